@@ -11,13 +11,26 @@ from reportlab.platypus import (
     PageBreak, KeepTogether
 )
 from reportlab.lib import colors
+from reportlab import rl_config, Version as REPORTLAB_VERSION
 from datetime import datetime
-import os
+import hashlib
+import io
+from pathlib import Path
+
+# Fixed creation date and document ID so identical content gives identical bytes
+rl_config.invariant = 1
+
+# Output path
+DOCS_DIR = Path(__file__).resolve().parent.parent / 'docs'
+DOCS_DIR.mkdir(exist_ok=True)
+OUTPUT_PATH = DOCS_DIR / 'COMMANDS_REFERENCE.pdf'
+HASH_PATH = DOCS_DIR / '.commands-reference.hash'
 
 # Colors
 PRIMARY_COLOR = HexColor('#2563eb')
 SECONDARY_COLOR = HexColor('#64748b')
 CODE_BG = HexColor('#f1f5f9')
+HEADING2_COLOR = HexColor('#1e40af')
 
 def create_styles():
     """Create custom paragraph styles."""
@@ -48,7 +61,7 @@ def create_styles():
         'CustomHeading2',
         parent=styles['Heading2'],
         fontSize=13,
-        textColor=HexColor('#1e40af'),
+        textColor=HEADING2_COLOR,
         spaceBefore=15,
         spaceAfter=8
     ))
@@ -64,6 +77,14 @@ def create_styles():
         spaceAfter=5
     ))
 
+    styles.add(ParagraphStyle(
+        'Subtitle',
+        parent=styles['Normal'],
+        fontSize=14,
+        textColor=SECONDARY_COLOR,
+        alignment=1
+    ))
+
     styles.add(ParagraphStyle(
         'BulletItem',
         parent=styles['Normal'],
@@ -83,40 +104,57 @@ def create_styles():
 
     return styles
 
-def create_pdf():
-    """Generate the PDF document."""
-    output_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        'docs',
-        'COMMANDS_REFERENCE.pdf'
-    )
+STYLES = create_styles()
+
+COMMAND_TABLE_CMDS = (
+    ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('TOPPADDING', (0, 0), (-1, 0), 10),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('FONTNAME', (0, 1), (0, -1), 'Courier'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 0.5, SECONDARY_COLOR),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), (colors.white, CODE_BG)),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+    ('TOPPADDING', (0, 1), (-1, -1), 6),
+)
 
-    doc = SimpleDocTemplate(
-        output_path,
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch
-    )
+COMMAND_TABLE_STYLE = TableStyle(COMMAND_TABLE_CMDS)
+
+def _make_table(data, col_widths, style):
+    """Build a Table and apply its style in one step."""
+    table = Table(data, colWidths=col_widths)
+    table.setStyle(style)
+    return table
 
-    styles = create_styles()
+def _build_story():
+    """Build the document flowables."""
+    styles = STYLES
+    now = datetime.now()
+    date_str = now.strftime('%Y-%m-%d')
+    datetime_str = now.strftime('%Y-%m-%d %H:%M')
     story = []
 
     # Title Page
-    story.append(Spacer(1, 2*inch))
-    story.append(Paragraph('Slash Commands Reference', styles['CustomTitle']))
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph(
-        '<b>antigravity-jules-orchestration</b>',
-        ParagraphStyle('Subtitle', parent=styles['Normal'], fontSize=14, alignment=1, textColor=SECONDARY_COLOR)
-    ))
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph(
-        f'Version 2.5.0 | Generated: {datetime.now().strftime("%Y-%m-%d")}',
-        styles['Footer']
-    ))
-    story.append(PageBreak())
+    story.extend([
+        Spacer(1, 2*inch),
+        Paragraph('Slash Commands Reference', styles['CustomTitle']),
+        Spacer(1, 0.3*inch),
+        Paragraph(
+            '<b>antigravity-jules-orchestration</b>',
+            styles['Subtitle']
+        ),
+        Spacer(1, 0.2*inch),
+        Paragraph(
+            f'Version 2.5.0 | Generated: {date_str}',
+            styles['Footer']
+        ),
+        PageBreak(),
+    ])
 
     # Table of Contents
     story.append(Paragraph('Table of Contents', styles['CustomHeading1']))
@@ -133,68 +171,81 @@ def create_pdf():
         '6. Recommended Workflows',
         '7. MCP Tools Integration',
     ]
-    for item in toc_items:
-        story.append(Paragraph(item, styles['BulletItem']))
+    story.append(Paragraph('<br/>'.join(toc_items), styles['BulletItem']))
     story.append(PageBreak())
 
     # Core Commands Section
     story.append(Paragraph('1. Core Commands', styles['CustomHeading1']))
 
     # /status
-    story.append(Paragraph('/status', styles['CustomHeading2']))
-    story.append(Paragraph(
-        'Get a comprehensive overview of all Jules sessions, system health, and orchestration status.',
-        styles['Normal']
-    ))
-    story.append(Paragraph('<font face="Courier">/status</font>', styles['CodeBlock']))
-    story.append(Paragraph('<b>Output:</b>', styles['Normal']))
-    for item in ['Active sessions with state', 'Session statistics (total, completed, in progress, failed)',
-                 'System health (circuit breaker, cache, rate limits)', 'Quick action suggestions']:
-        story.append(Paragraph(f'&bull; {item}', styles['BulletItem']))
+    story.extend([
+        Paragraph('/status', styles['CustomHeading2']),
+        Paragraph(
+            'Get a comprehensive overview of all Jules sessions, system health, and orchestration status.',
+            styles['Normal']
+        ),
+        Paragraph('/status', styles['CodeBlock']),
+        Paragraph('<b>Output:</b>', styles['Normal']),
+    ])
+    story.append(Paragraph('<br/>'.join(
+        f'&bull; {item}'
+        for item in ['Active sessions with state', 'Session statistics (total, completed, in progress, failed)',
+                     'System health (circuit breaker, cache, rate limits)', 'Quick action suggestions']
+    ), styles['BulletItem']))
     story.append(Spacer(1, 0.2*inch))
 
     # /quick-fix
-    story.append(Paragraph('/quick-fix [file] [description]', styles['CustomHeading2']))
-    story.append(Paragraph(
-        'Fast, streamlined workflow for single-file fixes using Jules autonomous coding.',
-        styles['Normal']
-    ))
-    story.append(Paragraph(
-        '<font face="Courier">/quick-fix src/api/auth.js "Add rate limiting"</font>',
-        styles['CodeBlock']
-    ))
-    story.append(Paragraph('<b>Features:</b>', styles['Normal']))
-    for item in ['Auto-selects repository', 'Creates focused session', 'Skips plan approval for speed', 'Auto-creates PR']:
-        story.append(Paragraph(f'&bull; {item}', styles['BulletItem']))
+    story.extend([
+        Paragraph('/quick-fix [file] [description]', styles['CustomHeading2']),
+        Paragraph(
+            'Fast, streamlined workflow for single-file fixes using Jules autonomous coding.',
+            styles['Normal']
+        ),
+        Paragraph(
+            '/quick-fix src/api/auth.js "Add rate limiting"',
+            styles['CodeBlock']
+        ),
+        Paragraph('<b>Features:</b>', styles['Normal']),
+    ])
+    story.append(Paragraph('<br/>'.join(
+        f'&bull; {item}'
+        for item in ['Auto-selects repository', 'Creates focused session', 'Skips plan approval for speed', 'Auto-creates PR']
+    ), styles['BulletItem']))
     story.append(Spacer(1, 0.2*inch))
 
     # /session
-    story.append(Paragraph('/session [id] [action]', styles['CustomHeading2']))
-    story.append(Paragraph('Quick session management for Jules coding sessions.', styles['Normal']))
-    story.append(Paragraph(
-        '<font face="Courier">/session ses_abc123 approve</font>',
-        styles['CodeBlock']
-    ))
-    story.append(Paragraph('<b>Actions:</b> view (default), approve, cancel, retry, diff', styles['Normal']))
-    story.append(Spacer(1, 0.2*inch))
+    story.extend([
+        Paragraph('/session [id] [action]', styles['CustomHeading2']),
+        Paragraph('Quick session management for Jules coding sessions.', styles['Normal']),
+        Paragraph(
+            '/session ses_abc123 approve',
+            styles['CodeBlock']
+        ),
+        Paragraph('<b>Actions:</b> view (default), approve, cancel, retry, diff', styles['Normal']),
+        Spacer(1, 0.2*inch),
+    ])
 
     # /batch
-    story.append(Paragraph('/batch [label] [repo?]', styles['CustomHeading2']))
-    story.append(Paragraph('Quick batch session creation from GitHub issue labels.', styles['Normal']))
-    story.append(Paragraph(
-        '<font face="Courier">/batch jules-auto</font>',
-        styles['CodeBlock']
-    ))
-    story.append(Paragraph('<b>Common Labels:</b> jules-auto, bug, enhancement, security', styles['Normal']))
-    story.append(PageBreak())
+    story.extend([
+        Paragraph('/batch [label] [repo?]', styles['CustomHeading2']),
+        Paragraph('Quick batch session creation from GitHub issue labels.', styles['Normal']),
+        Paragraph(
+            '/batch jules-auto',
+            styles['CodeBlock']
+        ),
+        Paragraph('<b>Common Labels:</b> jules-auto, bug, enhancement, security', styles['Normal']),
+        PageBreak(),
+    ])
 
     # Workflow Commands Section
     story.append(Paragraph('2. Workflow Commands', styles['CustomHeading1']))
 
     # /audit
-    story.append(Paragraph('/audit', styles['CustomHeading2']))
-    story.append(Paragraph('Run a comprehensive parallel audit of the entire repository.', styles['Normal']))
-    story.append(Paragraph('<b>Parallel Agents:</b>', styles['Normal']))
+    story.extend([
+        Paragraph('/audit', styles['CustomHeading2']),
+        Paragraph('Run a comprehensive parallel audit of the entire repository.', styles['Normal']),
+        Paragraph('<b>Parallel Agents:</b>', styles['Normal']),
+    ])
     agents = [
         'Security Audit - vulnerabilities, secrets, auth patterns',
         'Code Quality Review - error handling, async patterns, style',
@@ -202,65 +253,77 @@ def create_pdf():
         'API Endpoint Review - validation, status codes, rate limiting',
         'Documentation Completeness - accuracy, coverage'
     ]
-    for i, agent in enumerate(agents, 1):
-        story.append(Paragraph(f'{i}. {agent}', styles['BulletItem']))
+    story.append(Paragraph('<br/>'.join(f'{i}. {agent}' for i, agent in enumerate(agents, 1)), styles['BulletItem']))
     story.append(Spacer(1, 0.2*inch))
 
     # /deploy-check
-    story.append(Paragraph('/deploy-check', styles['CustomHeading2']))
-    story.append(Paragraph('Pre-deployment validation with live health checks.', styles['Normal']))
-    story.append(Paragraph('<b>Checks:</b>', styles['Normal']))
-    for item in ['Git status (uncommitted changes)', 'All tests passing', 'No high/critical vulnerabilities',
-                 'Health endpoint responding', 'All services configured']:
-        story.append(Paragraph(f'&bull; {item}', styles['BulletItem']))
+    story.extend([
+        Paragraph('/deploy-check', styles['CustomHeading2']),
+        Paragraph('Pre-deployment validation with live health checks.', styles['Normal']),
+        Paragraph('<b>Checks:</b>', styles['Normal']),
+    ])
+    story.append(Paragraph('<br/>'.join(
+        f'&bull; {item}'
+        for item in ['Git status (uncommitted changes)', 'All tests passing', 'No high/critical vulnerabilities',
+                     'Health endpoint responding', 'All services configured']
+    ), styles['BulletItem']))
     story.append(Spacer(1, 0.2*inch))
 
     # /implement-feature
-    story.append(Paragraph('/implement-feature [description]', styles['CustomHeading2']))
-    story.append(Paragraph('Feature implementation workflow with planning.', styles['Normal']))
-    story.append(Paragraph(
-        '<font face="Courier">/implement-feature "Add webhook retry mechanism"</font>',
-        styles['CodeBlock']
-    ))
-    story.append(Paragraph('<b>Steps:</b> Analyze requirements, Create plan, Generate code, Create tests, Update docs', styles['Normal']))
-    story.append(Spacer(1, 0.2*inch))
+    story.extend([
+        Paragraph('/implement-feature [description]', styles['CustomHeading2']),
+        Paragraph('Feature implementation workflow with planning.', styles['Normal']),
+        Paragraph(
+            '/implement-feature "Add webhook retry mechanism"',
+            styles['CodeBlock']
+        ),
+        Paragraph('<b>Steps:</b> Analyze requirements, Create plan, Generate code, Create tests, Update docs', styles['Normal']),
+        Spacer(1, 0.2*inch),
+    ])
 
     # /fix-issues
-    story.append(Paragraph('/fix-issues', styles['CustomHeading2']))
-    story.append(Paragraph('Auto-diagnose and fix common issues.', styles['Normal']))
-    story.append(Paragraph('<b>Fixes:</b> TypeScript errors, Linting issues, Failing tests, Outdated dependencies, Missing imports', styles['Normal']))
-    story.append(PageBreak())
+    story.extend([
+        Paragraph('/fix-issues', styles['CustomHeading2']),
+        Paragraph('Auto-diagnose and fix common issues.', styles['Normal']),
+        Paragraph('<b>Fixes:</b> TypeScript errors, Linting issues, Failing tests, Outdated dependencies, Missing imports', styles['Normal']),
+        PageBreak(),
+    ])
 
     # Security & Testing Section
     story.append(Paragraph('3. Security & Testing', styles['CustomHeading1']))
 
     # /security
-    story.append(Paragraph('/security [scope]', styles['CustomHeading2']))
-    story.append(Paragraph('Dedicated security scanning.', styles['Normal']))
-    story.append(Paragraph(
-        '<font face="Courier">/security quick</font>',
-        styles['CodeBlock']
-    ))
-    story.append(Paragraph('<b>Scope Options:</b>', styles['Normal']))
+    story.extend([
+        Paragraph('/security [scope]', styles['CustomHeading2']),
+        Paragraph('Dedicated security scanning.', styles['Normal']),
+        Paragraph(
+            '/security quick',
+            styles['CodeBlock']
+        ),
+        Paragraph('<b>Scope Options:</b>', styles['Normal']),
+    ])
     scopes = ['full - Complete security audit (default)', 'quick - Critical issues only',
               'deps - npm audit', 'secrets - Credential scanning', 'api - Endpoint security testing']
-    for scope in scopes:
-        story.append(Paragraph(f'&bull; {scope}', styles['BulletItem']))
+    story.append(Paragraph('<br/>'.join(f'&bull; {scope}' for scope in scopes), styles['BulletItem']))
     story.append(Spacer(1, 0.2*inch))
 
     # /test
-    story.append(Paragraph('/test [scope] [options]', styles['CustomHeading2']))
-    story.append(Paragraph('Run all tests with coverage and detailed reporting.', styles['Normal']))
-    story.append(Paragraph(
-        '<font face="Courier">/test all --coverage</font>',
-        styles['CodeBlock']
-    ))
-    story.append(Paragraph('<b>Scope:</b> all (default), backend, dashboard, unit, integration', styles['Normal']))
-    story.append(PageBreak())
+    story.extend([
+        Paragraph('/test [scope] [options]', styles['CustomHeading2']),
+        Paragraph('Run all tests with coverage and detailed reporting.', styles['Normal']),
+        Paragraph(
+            '/test all --coverage',
+            styles['CodeBlock']
+        ),
+        Paragraph('<b>Scope:</b> all (default), backend, dashboard, unit, integration', styles['Normal']),
+        PageBreak(),
+    ])
 
     # Quick Reference Table
-    story.append(Paragraph('4. Quick Reference Table', styles['CustomHeading1']))
-    story.append(Spacer(1, 0.1*inch))
+    story.extend([
+        Paragraph('4. Quick Reference Table', styles['CustomHeading1']),
+        Spacer(1, 0.1*inch),
+    ])
 
     table_data = [
         ['Command', 'Purpose', 'Example'],
@@ -276,25 +339,11 @@ def create_pdf():
         ['/test', 'Run tests', '/test all'],
     ]
 
-    table = Table(table_data, colWidths=[1.5*inch, 2*inch, 2.5*inch])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('TOPPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('FONTNAME', (0, 1), (0, -1), 'Courier'),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('GRID', (0, 0), (-1, -1), 0.5, SECONDARY_COLOR),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, CODE_BG]),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-        ('TOPPADDING', (0, 1), (-1, -1), 6),
-    ]))
-    story.append(table)
-    story.append(PageBreak())
+    table = _make_table(table_data, [1.5*inch, 2*inch, 2.5*inch], COMMAND_TABLE_STYLE)
+    story.extend([
+        table,
+        PageBreak(),
+    ])
 
     # Recommended Workflows
     story.append(Paragraph('5. Recommended Workflows', styles['CustomHeading1']))
@@ -312,18 +361,19 @@ def create_pdf():
 
     for title, steps in workflows:
         story.append(Paragraph(title, styles['CustomHeading2']))
-        for step in steps:
-            story.append(Paragraph(step, styles['BulletItem']))
+        story.append(Paragraph('<br/>'.join(steps), styles['BulletItem']))
         story.append(Spacer(1, 0.15*inch))
     story.append(PageBreak())
 
     # MCP Tools Integration
-    story.append(Paragraph('6. MCP Tools Integration', styles['CustomHeading1']))
-    story.append(Paragraph(
-        'These commands leverage the 45 MCP tools available in v2.5.0:',
-        styles['Normal']
-    ))
-    story.append(Spacer(1, 0.1*inch))
+    story.extend([
+        Paragraph('6. MCP Tools Integration', styles['CustomHeading1']),
+        Paragraph(
+            'These commands leverage the 45 MCP tools available in v2.5.0:',
+            styles['Normal']
+        ),
+        Spacer(1, 0.1*inch),
+    ])
 
     tool_categories = [
         ('Jules Core', 'jules_list_sources, jules_create_session, jules_list_sessions, jules_get_session, jules_send_message, jules_approve_plan, jules_get_activities'),
@@ -340,21 +390,69 @@ def create_pdf():
     ]
 
     for category, tools in tool_categories:
-        story.append(Paragraph(f'<b>{category}:</b>', styles['Normal']))
-        story.append(Paragraph(f'<font face="Courier" size="8">{tools}</font>', styles['BulletItem']))
-        story.append(Spacer(1, 0.08*inch))
+        story.extend([
+            Paragraph(f'<b>{category}:</b>', styles['Normal']),
+            Paragraph(f'<font face="Courier" size="8">{tools}</font>', styles['BulletItem']),
+            Spacer(1, 0.08*inch),
+        ])
 
     # Footer
-    story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph(
-        f'Generated by antigravity-jules-orchestration v2.5.0 | {datetime.now().strftime("%Y-%m-%d %H:%M")} | https://scarmonit.com',
-        styles['Footer']
-    ))
+    story.extend([
+        Spacer(1, 0.5*inch),
+        Paragraph(
+            f'Generated by antigravity-jules-orchestration v2.5.0 | {datetime_str} | https://scarmonit.com',
+            styles['Footer']
+        ),
+    ])
+
+    return story
+
+def _spec_hash():
+    """Hash everything that determines the document content.
+
+    The content is defined inline in this script, so its source plus the
+    ReportLab version stand in for the story spec.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(Path(__file__).read_bytes())
+    h.update(REPORTLAB_VERSION.encode())
+    return h.hexdigest()
+
+def create_pdf(fileobj=None):
+    """Generate the PDF document.
+
+    Builds into fileobj (any writable binary object) when given, returning
+    its bytes if it is BytesIO-like and None for plain file handles;
+    otherwise writes the document to OUTPUT_PATH and returns the path.
+    The disk write is skipped when the existing PDF matches the spec hash.
+    """
+    if fileobj is None:
+        spec_hash = _spec_hash()
+        if OUTPUT_PATH.exists() and HASH_PATH.exists() and HASH_PATH.read_text() == spec_hash:
+            print(f'PDF up to date: {OUTPUT_PATH}')
+            return str(OUTPUT_PATH)
+
+    buf = fileobj if fileobj is not None else io.BytesIO()
 
     # Build PDF
-    doc.build(story)
-    print(f'PDF generated: {output_path}')
-    return output_path
+    doc = SimpleDocTemplate(
+        buf,
+        pagesize=letter,
+        rightMargin=0.75*inch,
+        leftMargin=0.75*inch,
+        topMargin=0.75*inch,
+        bottomMargin=0.75*inch
+    )
+    doc.build(_build_story())
+
+    if fileobj is not None:
+        getvalue = getattr(fileobj, 'getvalue', None)
+        return getvalue() if getvalue is not None else None
+
+    OUTPUT_PATH.write_bytes(buf.getvalue())
+    HASH_PATH.write_text(spec_hash)
+    print(f'PDF generated: {OUTPUT_PATH}')
+    return str(OUTPUT_PATH)
 
 if __name__ == '__main__':
     create_pdf()
@@ -10,85 +10,123 @@ from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib import colors
+from reportlab import rl_config, Version as REPORTLAB_VERSION
 from datetime import datetime
-import os
-
-def create_deployment_pdf():
-    # Output path
-    output_path = os.path.join(os.path.dirname(__file__), '..', 'docs', 'DEPLOYMENT_DOCUMENTATION.pdf')
-
-    # Create the PDF
-    doc = SimpleDocTemplate(
-        output_path,
-        pagesize=letter,
-        rightMargin=72,
-        leftMargin=72,
-        topMargin=72,
-        bottomMargin=72
-    )
-
-    # Styles
-    styles = getSampleStyleSheet()
-
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Title'],
-        fontSize=24,
-        spaceAfter=30,
-        textColor=HexColor('#1a1a2e')
-    )
-
-    heading1_style = ParagraphStyle(
-        'CustomHeading1',
-        parent=styles['Heading1'],
-        fontSize=16,
-        spaceBefore=20,
-        spaceAfter=12,
-        textColor=HexColor('#16213e')
-    )
-
-    heading2_style = ParagraphStyle(
-        'CustomHeading2',
-        parent=styles['Heading2'],
-        fontSize=13,
-        spaceBefore=15,
-        spaceAfter=8,
-        textColor=HexColor('#0f3460')
+import hashlib
+import io
+from pathlib import Path
+
+# Fixed creation date and document ID so identical content gives identical bytes
+rl_config.invariant = 1
+
+# Output path
+DOCS_DIR = Path(__file__).resolve().parent.parent / 'docs'
+DOCS_DIR.mkdir(exist_ok=True)
+OUTPUT_PATH = DOCS_DIR / 'DEPLOYMENT_DOCUMENTATION.pdf'
+HASH_PATH = DOCS_DIR / '.deployment-documentation.hash'
+
+# Colors
+TITLE_COLOR = HexColor('#1a1a2e')
+HEADING1_COLOR = HexColor('#16213e')
+HEADING2_COLOR = HexColor('#0f3460')
+ROW_BG = HexColor('#f8f9fa')
+GRID_COLOR = HexColor('#dee2e6')
+CODE_BG = HexColor('#f5f5f5')
+
+# Styles
+_base_styles = getSampleStyleSheet()
+
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_base_styles['Title'],
+    fontSize=24,
+    spaceAfter=30,
+    textColor=TITLE_COLOR
+)
+
+HEADING1_STYLE = ParagraphStyle(
+    'CustomHeading1',
+    parent=_base_styles['Heading1'],
+    fontSize=16,
+    spaceBefore=20,
+    spaceAfter=12,
+    textColor=HEADING1_COLOR
+)
+
+HEADING2_STYLE = ParagraphStyle(
+    'CustomHeading2',
+    parent=_base_styles['Heading2'],
+    fontSize=13,
+    spaceBefore=15,
+    spaceAfter=8,
+    textColor=HEADING2_COLOR
+)
+
+BODY_STYLE = ParagraphStyle(
+    'CustomBody',
+    parent=_base_styles['Normal'],
+    fontSize=10,
+    spaceAfter=8,
+    leading=14
+)
+
+CODE_STYLE = ParagraphStyle(
+    'Code',
+    parent=_base_styles['Normal'],
+    fontSize=9,
+    fontName='Courier',
+    backColor=CODE_BG,
+    spaceAfter=8,
+    leftIndent=20
+)
+
+# Table styles
+def _table_cmds(header_bg, body_bg):
+    """Return the shared grid table commands for the given header/body colors."""
+    return (
+        ('BACKGROUND', (0, 0), (-1, 0), header_bg),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), body_bg),
+        ('GRID', (0, 0), (-1, -1), 1, GRID_COLOR),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('TOPPADDING', (0, 1), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
     )
 
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceAfter=8,
-        leading=14
-    )
+MIGRATION_TABLE_STYLE = TableStyle(_table_cmds(TITLE_COLOR, ROW_BG))
+ARCH_TABLE_STYLE = TableStyle(_table_cmds(HEADING1_COLOR, colors.white))
+ENV_TABLE_STYLE = TableStyle(_table_cmds(HEADING2_COLOR, ROW_BG))
 
-    code_style = ParagraphStyle(
-        'Code',
-        parent=styles['Normal'],
-        fontSize=9,
-        fontName='Courier',
-        backColor=HexColor('#f5f5f5'),
-        spaceAfter=8,
-        leftIndent=20
-    )
+def _make_table(data, col_widths, style):
+    """Build a Table and apply its style in one step."""
+    table = Table(data, colWidths=col_widths)
+    table.setStyle(style)
+    return table
 
+def _build_story():
+    """Build the document flowables."""
     # Document content
     story = []
 
     # Title
-    story.append(Paragraph("Jules MCP Server - Deployment Documentation", title_style))
-    story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", body_style))
-    story.append(Spacer(1, 20))
+    story.extend([
+        Paragraph("Jules MCP Server - Deployment Documentation", TITLE_STYLE),
+        Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", BODY_STYLE),
+        Spacer(1, 20),
+    ])
 
     # Domain Migration Section
-    story.append(Paragraph("1. Domain Migration Summary", heading1_style))
-    story.append(Paragraph(
-        "This document details the production domain migration from the Render platform URL to the custom Scarmonit domain.",
-        body_style
-    ))
+    story.extend([
+        Paragraph("1. Domain Migration Summary", HEADING1_STYLE),
+        Paragraph(
+            "This document details the production domain migration from the Render platform URL to the custom Scarmonit domain.",
+            BODY_STYLE
+        ),
+    ])
 
     migration_data = [
         ['Property', 'Previous', 'Current'],
@@ -100,25 +138,14 @@ def create_deployment_pdf():
         ['CDN', 'None', 'Cloudflare'],
     ]
 
-    migration_table = Table(migration_data, colWidths=[1.5*inch, 2.5*inch, 2*inch])
-    migration_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#1a1a2e')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), HexColor('#f8f9fa')),
-        ('GRID', (0, 0), (-1, -1), 1, HexColor('#dee2e6')),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-    ]))
-    story.append(migration_table)
-    story.append(Spacer(1, 20))
+    migration_table = _make_table(migration_data, [1.5*inch, 2.5*inch, 2*inch], MIGRATION_TABLE_STYLE)
+    story.extend([
+        migration_table,
+        Spacer(1, 20),
+    ])
 
     # Architecture Section
-    story.append(Paragraph("2. Production Architecture", heading1_style))
+    story.append(Paragraph("2. Production Architecture", HEADING1_STYLE))
 
     arch_data = [
         ['Layer', 'Technology', 'Purpose'],
@@ -130,51 +157,46 @@ def create_deployment_pdf():
         ['External', 'Google Jules API', 'AI coding sessions'],
     ]
 
-    arch_table = Table(arch_data, colWidths=[1.5*inch, 1.8*inch, 2.7*inch])
-    arch_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#16213e')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), HexColor('#ffffff')),
-        ('GRID', (0, 0), (-1, -1), 1, HexColor('#dee2e6')),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-    ]))
-    story.append(arch_table)
-    story.append(Spacer(1, 20))
+    arch_table = _make_table(arch_data, [1.5*inch, 1.8*inch, 2.7*inch], ARCH_TABLE_STYLE)
+    story.extend([
+        arch_table,
+        Spacer(1, 20),
+    ])
 
     # API Endpoints Section
-    story.append(Paragraph("3. API Endpoints", heading1_style))
-
-    story.append(Paragraph("3.1 Health Check", heading2_style))
-    story.append(Paragraph("GET https://scarmonit.com/health", code_style))
-    story.append(Paragraph(
-        "Returns server health status, version, and configuration state. Used for monitoring and load balancer health checks.",
-        body_style
-    ))
-
-    story.append(Paragraph("3.2 MCP Tools List", heading2_style))
-    story.append(Paragraph("GET https://scarmonit.com/mcp/tools", code_style))
-    story.append(Paragraph(
-        "Returns list of available MCP tools: jules_list_sources, jules_create_session, jules_list_sessions, jules_get_session, jules_send_message, jules_approve_plan, jules_get_activities.",
-        body_style
-    ))
-
-    story.append(Paragraph("3.3 MCP Execute", heading2_style))
-    story.append(Paragraph("POST https://scarmonit.com/mcp/execute", code_style))
-    story.append(Paragraph(
-        "Executes MCP tools. Requires X-API-Key header for write operations. Request body: {tool: string, parameters: object}.",
-        body_style
-    ))
+    story.append(Paragraph("3. API Endpoints", HEADING1_STYLE))
+
+    story.extend([
+        Paragraph("3.1 Health Check", HEADING2_STYLE),
+        Paragraph("GET https://scarmonit.com/health", CODE_STYLE),
+        Paragraph(
+            "Returns server health status, version, and configuration state. Used for monitoring and load balancer health checks.",
+            BODY_STYLE
+        ),
+    ])
+
+    story.extend([
+        Paragraph("3.2 MCP Tools List", HEADING2_STYLE),
+        Paragraph("GET https://scarmonit.com/mcp/tools", CODE_STYLE),
+        Paragraph(
+            "Returns list of available MCP tools: jules_list_sources, jules_create_session, jules_list_sessions, jules_get_session, jules_send_message, jules_approve_plan, jules_get_activities.",
+            BODY_STYLE
+        ),
+    ])
+
+    story.extend([
+        Paragraph("3.3 MCP Execute", HEADING2_STYLE),
+        Paragraph("POST https://scarmonit.com/mcp/execute", CODE_STYLE),
+        Paragraph(
+            "Executes MCP tools. Requires X-API-Key header for write operations. Request body: {tool: string, parameters: object}.",
+            BODY_STYLE
+        ),
+    ])
 
     story.append(PageBreak())
 
     # Configuration Section
-    story.append(Paragraph("4. Environment Configuration", heading1_style))
+    story.append(Paragraph("4. Environment Configuration", HEADING1_STYLE))
 
     env_data = [
         ['Variable', 'Required', 'Description'],
@@ -185,29 +207,20 @@ def create_deployment_pdf():
         ['NODE_ENV', 'No', 'Environment (production/development)'],
     ]
 
-    env_table = Table(env_data, colWidths=[2.5*inch, 0.8*inch, 2.7*inch])
-    env_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#0f3460')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), HexColor('#f8f9fa')),
-        ('GRID', (0, 0), (-1, -1), 1, HexColor('#dee2e6')),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-    ]))
-    story.append(env_table)
-    story.append(Spacer(1, 20))
+    env_table = _make_table(env_data, [2.5*inch, 0.8*inch, 2.7*inch], ENV_TABLE_STYLE)
+    story.extend([
+        env_table,
+        Spacer(1, 20),
+    ])
 
     # Files Updated Section
-    story.append(Paragraph("5. Files Updated in Migration", heading1_style))
-    story.append(Paragraph(
-        "The following files were updated to reference the new production domain (scarmonit.com):",
-        body_style
-    ))
+    story.extend([
+        Paragraph("5. Files Updated in Migration", HEADING1_STYLE),
+        Paragraph(
+            "The following files were updated to reference the new production domain (scarmonit.com):",
+            BODY_STYLE
+        ),
+    ])
 
     files_updated = [
         "CLAUDE.md - Project configuration",
@@ -222,51 +235,103 @@ def create_deployment_pdf():
         "docs/*.md - Documentation files (8 files)",
     ]
 
-    for f in files_updated:
-        story.append(Paragraph(f"  - {f}", body_style))
+    story.append(Paragraph("<br/>".join(f"  - {f}" for f in files_updated), BODY_STYLE))
 
     story.append(Spacer(1, 20))
 
     # Verification Section
-    story.append(Paragraph("6. Deployment Verification", heading1_style))
-
-    story.append(Paragraph("6.1 Health Check Verification", heading2_style))
-    story.append(Paragraph("curl https://scarmonit.com/health", code_style))
-    story.append(Paragraph('Expected: {"status":"ok","version":"2.3.0",...}', body_style))
-
-    story.append(Paragraph("6.2 MCP Tools Verification", heading2_style))
-    story.append(Paragraph("curl https://scarmonit.com/mcp/tools", code_style))
-    story.append(Paragraph('Expected: {"tools":[...7 jules tools...]}', body_style))
-
-    story.append(Paragraph("6.3 SSL/TLS Verification", heading2_style))
-    story.append(Paragraph("curl -I https://scarmonit.com", code_style))
-    story.append(Paragraph('Expected: HTTP/2 200, valid SSL certificate from Cloudflare', body_style))
+    story.append(Paragraph("6. Deployment Verification", HEADING1_STYLE))
+
+    story.extend([
+        Paragraph("6.1 Health Check Verification", HEADING2_STYLE),
+        Paragraph("curl https://scarmonit.com/health", CODE_STYLE),
+        Paragraph('Expected: {"status":"ok","version":"2.3.0",...}', BODY_STYLE),
+    ])
+
+    story.extend([
+        Paragraph("6.2 MCP Tools Verification", HEADING2_STYLE),
+        Paragraph("curl https://scarmonit.com/mcp/tools", CODE_STYLE),
+        Paragraph('Expected: {"tools":[...7 jules tools...]}', BODY_STYLE),
+    ])
+
+    story.extend([
+        Paragraph("6.3 SSL/TLS Verification", HEADING2_STYLE),
+        Paragraph("curl -I https://scarmonit.com", CODE_STYLE),
+        Paragraph('Expected: HTTP/2 200, valid SSL certificate from Cloudflare', BODY_STYLE),
+    ])
 
     story.append(Spacer(1, 20))
 
     # Contact Section
-    story.append(Paragraph("7. Support & Monitoring", heading1_style))
-    story.append(Paragraph(
-        "Production URL: https://scarmonit.com",
-        body_style
-    ))
-    story.append(Paragraph(
-        "Health Dashboard: https://dashboard.render.com",
-        body_style
-    ))
-    story.append(Paragraph(
-        "DNS Management: https://dash.cloudflare.com",
-        body_style
-    ))
-    story.append(Paragraph(
-        "Repository: https://github.com/scarmonit/antigravity-jules-orchestration",
-        body_style
-    ))
+    story.extend([
+        Paragraph("7. Support & Monitoring", HEADING1_STYLE),
+        Paragraph(
+            "Production URL: https://scarmonit.com",
+            BODY_STYLE
+        ),
+        Paragraph(
+            "Health Dashboard: https://dashboard.render.com",
+            BODY_STYLE
+        ),
+        Paragraph(
+            "DNS Management: https://dash.cloudflare.com",
+            BODY_STYLE
+        ),
+        Paragraph(
+            "Repository: https://github.com/scarmonit/antigravity-jules-orchestration",
+            BODY_STYLE
+        ),
+    ])
+
+    return story
+
+def _spec_hash():
+    """Hash everything that determines the document content.
+
+    The content is defined inline in this script, so its source plus the
+    ReportLab version stand in for the story spec.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(Path(__file__).read_bytes())
+    h.update(REPORTLAB_VERSION.encode())
+    return h.hexdigest()
+
+def create_deployment_pdf(fileobj=None):
+    """Build the PDF into fileobj, or write it to OUTPUT_PATH.
+
+    fileobj may be any writable binary object. Its bytes are returned when
+    it is BytesIO-like (has getvalue()); for plain file handles the PDF is
+    written into the object and None is returned. When omitted, the
+    document is rendered in memory and written to disk in one call, or
+    skipped entirely if the existing PDF was built from the same spec hash.
+    """
+    if fileobj is None:
+        spec_hash = _spec_hash()
+        if OUTPUT_PATH.exists() and HASH_PATH.exists() and HASH_PATH.read_text() == spec_hash:
+            print(f"PDF up to date: {OUTPUT_PATH}")
+            return str(OUTPUT_PATH)
+
+    buf = fileobj if fileobj is not None else io.BytesIO()
 
     # Build the PDF
-    doc.build(story)
-    print(f"PDF generated: {output_path}")
-    return output_path
+    doc = SimpleDocTemplate(
+        buf,
+        pagesize=letter,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=72
+    )
+    doc.build(_build_story())
+
+    if fileobj is not None:
+        getvalue = getattr(fileobj, 'getvalue', None)
+        return getvalue() if getvalue is not None else None
+
+    OUTPUT_PATH.write_bytes(buf.getvalue())
+    HASH_PATH.write_text(spec_hash)
+    print(f"PDF generated: {OUTPUT_PATH}")
+    return str(OUTPUT_PATH)
 
 if __name__ == "__main__":
     create_deployment_pdf()